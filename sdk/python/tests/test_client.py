@@ -0,0 +1,505 @@
+"""Tests for the HTTP clients, using httpx mock transports."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+from httpx._decoders import SUPPORTED_DECODERS
+
+import veilchain.client as client_module
+from veilchain import AsyncVeilChain, VeilChain, VeilChainError, get_default_client
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client_module, "_BACKOFFS", (0.0,))
+
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def flaky(error: Exception, failures: int) -> tuple[Handler, list[int]]:
+    """Build a handler that raises ``error`` for the first ``failures`` calls."""
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return httpx.Response(200, json={"status": "ok"})
+
+    return handler, calls
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        httpx.ReadTimeout("timed out"),
+        httpx.ReadError("connection reset"),
+        httpx.RemoteProtocolError("server disconnected"),
+        httpx.ConnectError("refused"),
+    ],
+)
+def test_transport_errors_are_retried(error: Exception) -> None:
+    handler, calls = flaky(error, failures=2)
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http, retries=3)
+
+    assert client.health() == {"status": "ok"}
+    assert len(calls) == 3
+
+
+def test_transport_errors_raise_after_retries() -> None:
+    handler, calls = flaky(httpx.ReadTimeout("timed out"), failures=10)
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http, retries=2)
+
+    with pytest.raises(httpx.ReadTimeout):
+        client.health()
+    assert len(calls) == 3
+
+
+def test_client_errors_are_not_retried() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(404, json={"error": {"message": "not found"}})
+
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http, retries=3)
+
+    with pytest.raises(VeilChainError) as excinfo:
+        client.health()
+    assert excinfo.value.status == 404
+    assert len(calls) == 1
+
+
+async def test_async_transport_errors_are_retried() -> None:
+    handler, calls = flaky(httpx.ReadTimeout("timed out"), failures=2)
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncVeilChain(base_url="https://api.test", client=http, retries=3)
+
+    assert await client.health() == {"status": "ok"}
+    assert len(calls) == 3
+
+
+def batch_handler(status: int = 200, failures: int = 0) -> tuple[Handler, list[bytes]]:
+    """Build a batch endpoint handler that answers ``status`` ``failures`` times first.
+
+    After that it behaves like the server: entries with null data are
+    rejected, each appended entry advances the root, and the response is 201,
+    207 (partial failure) or 400 (every entry rejected).
+    """
+    bodies: list[bytes] = []
+    appended: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        if len(bodies) <= failures:
+            return httpx.Response(status, json={"error": {"message": "unavailable"}})
+        previous_root = f"{len(appended):064x}"
+        results: list[dict[str, Any]] = []
+        for item in json.loads(request.content)["entries"]:
+            if item["data"] is None:
+                error = {"code": "INVALID_DATA", "message": "Entry data is required"}
+                results.append({"success": False, "error": error})
+            else:
+                appended.append(1)
+                results.append({"success": True})
+        successful = sum(result["success"] for result in results)
+        failed = len(results) - successful
+        code = 207 if failed and successful else 400 if failed else 201
+        return httpx.Response(
+            code,
+            json={
+                "results": results,
+                "summary": {"total": len(results), "successful": successful, "failed": failed},
+                "previousRoot": previous_root,
+                "newRoot": f"{len(appended):064x}",
+            },
+        )
+
+    return handler, bodies
+
+
+def test_append_entries_returns_results_for_each_status() -> None:
+    handler, bodies = batch_handler()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    created = client.append_entries("ledger", [1, 2])
+    assert created.summary.successful == 2
+    assert created.new_root == f"{2:064x}"
+
+    partial = client.append_entries("ledger", [3, None])
+    assert [result.success for result in partial.results] == [True, False]
+    assert partial.results[1].error is not None
+    assert partial.results[1].error.code == "INVALID_DATA"
+
+    rejected = client.append_entries("ledger", [None, None])
+    assert rejected.summary.failed == 2
+    assert rejected.results[0].error is not None
+    assert rejected.results[0].error.message == "Entry data is required"
+    assert rejected.previous_root == rejected.new_root == f"{3:064x}"
+    assert len(bodies) == 3
+
+
+def test_append_entries_keeps_committed_batches_when_a_batch_is_rejected() -> None:
+    handler, bodies = batch_handler()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    result = client.append_entries("ledger", [*range(1000), *[None] * 5])
+    assert [len(json.loads(body)["entries"]) for body in bodies] == [1000, 5]
+    assert result.summary.total == 1005
+    assert result.summary.successful == 1000
+    assert result.summary.failed == 5
+    assert result.previous_root == f"{0:064x}"
+    assert result.new_root == f"{1000:064x}"
+
+
+def test_append_entries_empty_makes_no_request() -> None:
+    handler, bodies = batch_handler()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    result = client.append_entries("ledger", [])
+    assert result.results == []
+    assert result.summary.total == 0
+    assert result.previous_root is None and result.new_root is None
+    assert bodies == []
+
+
+def test_append_entries_is_not_retried_without_idempotency_keys() -> None:
+    handler, bodies = batch_handler(status=503, failures=1)
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http, retries=3)
+
+    with pytest.raises(VeilChainError) as excinfo:
+        client.append_entries("ledger", [{"n": 1}, {"n": 2}])
+    assert excinfo.value.status == 503
+    assert len(bodies) == 1
+
+
+def test_append_entries_is_retried_with_idempotency_keys() -> None:
+    handler, bodies = batch_handler(status=503, failures=1)
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http, retries=3)
+
+    result = client.append_entries("ledger", [{"n": 1}, {"n": 2}], idempotency_keys=["a", "b"])
+    assert result.summary.total == 2
+    assert len(bodies) == 2
+    assert json.loads(bodies[-1])["entries"] == [
+        {"data": {"n": 1}, "idempotencyKey": "a"},
+        {"data": {"n": 2}, "idempotencyKey": "b"},
+    ]
+
+
+def test_append_entries_splits_large_batches() -> None:
+    handler, bodies = batch_handler()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    result = client.append_entries("ledger", list(range(2500)))
+    assert [len(json.loads(body)["entries"]) for body in bodies] == [1000, 1000, 500]
+    assert [json.loads(body)["entries"][0]["data"] for body in bodies] == [0, 1000, 2000]
+    assert result.summary.total == result.summary.successful == 2500
+    assert result.previous_root == f"{0:064x}"
+    assert result.new_root == f"{2500:064x}"
+
+
+def test_append_entries_rejects_mismatched_idempotency_keys() -> None:
+    handler, bodies = batch_handler()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    with pytest.raises(ValueError):
+        client.append_entries("ledger", [1, 2], idempotency_keys=["a"])
+    assert bodies == []
+
+
+async def test_async_append_entries_empty_makes_no_request() -> None:
+    handler, bodies = batch_handler()
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncVeilChain(base_url="https://api.test", client=http)
+
+    result = await client.append_entries("ledger", [])
+    assert result.summary.total == 0
+    assert bodies == []
+
+
+async def test_async_append_entries_returns_rejected_batches() -> None:
+    handler, bodies = batch_handler()
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncVeilChain(base_url="https://api.test", client=http)
+
+    result = await client.append_entries("ledger", [*range(1000), None])
+    assert result.summary.successful == 1000
+    assert result.summary.failed == 1
+    assert len(bodies) == 2
+
+
+def test_request_bodies_encode_integers_wider_than_64_bits() -> None:
+    handler, bodies = batch_handler()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    client.append_entries("ledger", [{"amount": 2**64}, {"amount": -(2**70)}])
+    assert json.loads(bodies[0])["entries"] == [
+        {"data": {"amount": 2**64}},
+        {"data": {"amount": -(2**70)}},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("installed", "version", "expected"),
+    [
+        (set(), "0.28.1", {"gzip", "deflate"}),
+        ({"brotlicffi"}, "0.28.1", {"gzip", "deflate", "br"}),
+        ({"brotli", "zstandard"}, "0.28.1", {"gzip", "deflate", "br", "zstd"}),
+        ({"zstandard"}, "0.27.0", {"gzip", "deflate"}),
+    ],
+)
+def test_decodable_encodings_follow_installed_packages(
+    monkeypatch: pytest.MonkeyPatch, installed: set[str], version: str, expected: set[str]
+) -> None:
+    monkeypatch.setattr(
+        client_module.importlib.util,
+        "find_spec",
+        lambda name: object() if name in installed else None,
+    )
+    monkeypatch.setattr(client_module.httpx, "__version__", version)
+
+    assert client_module._decodable_encodings() == expected
+
+
+def test_default_client_connect_errors_are_not_retried_twice(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The shared client's transport already retries connects, so the request
+    # loop must not multiply its attempts
+    handler, calls = flaky(httpx.ConnectError("refused"), failures=10)
+    monkeypatch.setattr(
+        client_module, "_default_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    client = VeilChain(base_url="https://api.test", client=get_default_client(), retries=3)
+
+    with pytest.raises(httpx.ConnectError):
+        client.health()
+    assert len(calls) == 1
+
+
+def auth_recorder() -> tuple[Handler, list[httpx.Headers]]:
+    """Build a handler that records the headers of each request."""
+    seen: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        return httpx.Response(200, json={"root": "00" * 32})
+
+    return handler, seen
+
+
+def test_assigning_credentials_updates_request_headers() -> None:
+    handler, seen = auth_recorder()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", api_key="key-1", client=http)
+
+    client.get_current_root("ledger")
+    client.api_key = "key-2"
+    client.get_current_root("ledger")
+    client.token = "jwt"
+    client.get_current_root("ledger")
+    client.set_token("jwt-2")
+    client.get_current_root("ledger")
+
+    assert [headers.get("X-API-Key") for headers in seen[:2]] == ["key-1", "key-2"]
+    assert [headers.get("Authorization") for headers in seen[2:]] == ["Bearer jwt", "Bearer jwt-2"]
+
+
+async def test_async_assigning_credentials_updates_request_headers() -> None:
+    handler, seen = auth_recorder()
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncVeilChain(base_url="https://api.test", token="jwt-1", client=http)
+
+    await client.get_current_root("ledger")
+    client.token = "jwt-2"
+    await client.get_current_root("ledger")
+
+    assert [headers["Authorization"] for headers in seen] == ["Bearer jwt-1", "Bearer jwt-2"]
+
+
+@pytest.mark.parametrize("status", [200, 204])
+def test_empty_object_responses_return_none(status: int) -> None:
+    http = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(status)))
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    assert client.health() is None
+    assert client.get_current_root("ledger") is None
+
+
+async def test_async_empty_object_responses_return_none() -> None:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(204)))
+    client = AsyncVeilChain(base_url="https://api.test", client=http)
+
+    assert await client.health() is None
+    assert await client.get_current_root("ledger") is None
+
+
+def entries_page(offset: int, limit: int, total: int) -> dict[str, Any]:
+    """Build a list-entries response body."""
+    entries = [
+        {
+            "id": f"e{i}",
+            "position": str(i),
+            "data": i,
+            "hash": "00" * 32,
+            "createdAt": "2024-01-01T00:00:00Z",
+        }
+        for i in range(offset, min(offset + limit, total))
+    ]
+    return {"entries": entries, "total": str(total), "offset": str(offset), "limit": limit}
+
+
+async def test_breaking_out_of_iter_entries_stops_the_prefetch() -> None:
+    prefetch_started = asyncio.Event()
+    prefetch_cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        if offset:
+            prefetch_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                prefetch_cancelled.set()
+                raise
+        return httpx.Response(200, json=entries_page(offset, 2, total=6))
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncVeilChain(base_url="https://api.test", client=http)
+
+    entries = client.iter_entries("ledger", page_size=2)
+    async for entry in entries:
+        assert entry.id == "e0"
+        await prefetch_started.wait()
+        break
+    await entries.aclose()  # type: ignore[attr-defined]
+
+    assert prefetch_cancelled.is_set()
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_max_concurrency_bounds_requests_in_flight() -> None:
+    in_flight: list[int] = []
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal peak
+        in_flight.append(1)
+        peak = max(peak, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return httpx.Response(200, json={"status": "ok"})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncVeilChain(base_url="https://api.test", client=http, max_concurrency=3)
+
+    results = await asyncio.gather(*(client.health() for _ in range(10)))
+    assert results == [{"status": "ok"}] * 10
+    assert peak == 3
+
+
+def test_max_concurrency_semaphore_is_created_on_first_request() -> None:
+    http = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"status": "ok"}))
+    )
+    client = AsyncVeilChain(base_url="https://api.test", client=http, max_concurrency=2)
+
+    # Built outside a loop, the semaphore is created on first request
+    assert client._semaphore is None
+    assert asyncio.run(client.health()) == {"status": "ok"}
+    assert client._semaphore is not None
+
+
+async def test_warm_up_is_cancelled_on_close() -> None:
+    warm_started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        warm_started.set()
+        await asyncio.sleep(10)
+        return httpx.Response(200, json={"status": "ok"})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncVeilChain(base_url="https://api.test", client=http, warm=True)
+    task = client._warm_task
+    assert task is not None
+
+    await warm_started.wait()
+    await client.close()
+    assert task.cancelled()
+
+
+async def test_warm_up_is_scheduled_on_enter_when_built_outside_a_loop() -> None:
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json={"status": "ok"})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = await asyncio.to_thread(
+        AsyncVeilChain, base_url="https://api.test", client=http, warm=True
+    )
+    assert client._warm_task is None
+
+    async with client:
+        assert client._warm_task is not None
+        await client._warm_task
+    assert requests == ["/health"]
+
+
+def test_sync_warm_up_sends_a_health_check() -> None:
+    warmed = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        warmed.set()
+        return httpx.Response(200, json={"status": "ok"})
+
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    VeilChain(base_url="https://api.test", client=http, warm=True)
+    assert warmed.wait(5)
+
+
+def test_accept_encoding_header_lists_only_decodable_encodings() -> None:
+    handler, seen = auth_recorder()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    client.get_current_root("ledger")
+    client.health()
+
+    advertised = [headers["Accept-Encoding"] for headers in seen]
+    assert advertised == [client_module._ACCEPT_ENCODING] * 2
+    # Cross-check the detection against the decoders httpx actually has
+    assert set(advertised[0].split(", ")) == set(SUPPORTED_DECODERS) - {"identity"}
+
+
+def test_gzip_responses_are_decoded() -> None:
+    body = gzip.compress(json.dumps({"status": "ok"}).encode())
+    http = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+        )
+    )
+    client = VeilChain(base_url="https://api.test", client=http)
+
+    assert client.health() == {"status": "ok"}
@@ -0,0 +1,226 @@
+"""Tests for offline proof verification."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from veilchain import (
+    MerkleProof,
+    Verifier,
+    hash_data,
+    verify_data_with_proof,
+    verify_proof,
+    verify_proofs,
+)
+
+
+def _sha256(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def build_tree(leaves: list[bytes]) -> list[list[bytes]]:
+    """Build Merkle tree layers (leaves first); an odd last node is promoted."""
+    layers = [leaves]
+    while len(layers[-1]) > 1:
+        level = layers[-1]
+        layers.append(
+            [
+                _sha256(level[i] + level[i + 1]) if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+        )
+    return layers
+
+
+def make_proof(layers: list[list[bytes]], index: int) -> MerkleProof:
+    """Build the inclusion proof for a leaf."""
+    siblings: list[str] = []
+    directions: list[str] = []
+    position = index
+    for level in layers[:-1]:
+        sibling = position ^ 1
+        if sibling < len(level):
+            siblings.append(level[sibling].hex())
+            directions.append("left" if sibling < position else "right")
+        position //= 2
+    return MerkleProof(
+        leaf=layers[0][index].hex(),
+        index=index,
+        proof=siblings,
+        directions=directions,
+        root=layers[-1][0].hex(),
+    )
+
+
+def test_verify_proof_valid_for_every_leaf() -> None:
+    layers = build_tree([_sha256(str(i).encode()) for i in range(11)])
+    for index in range(11):
+        assert verify_proof(make_proof(layers, index)).valid
+
+
+def test_copy_with_update_does_not_reuse_decoded_hashes() -> None:
+    layers = build_tree([_sha256(str(i).encode()) for i in range(8)])
+    proof = make_proof(layers, 3)
+    assert verify_proof(proof).valid  # populates the cached decoded fields
+
+    wrong_root = proof.model_copy(update={"root": "00" * 32})
+    assert not verify_proof(wrong_root).valid
+
+    wrong_leaf = proof.model_copy(update={"leaf": "11" * 32})
+    assert not verify_proof(wrong_leaf).valid
+    assert not verify_data_with_proof("3", wrong_leaf).valid
+
+    wrong_sibling = proof.model_copy(update={"proof": ["22" * 32, *proof.proof[1:]]})
+    assert not verify_proof(wrong_sibling).valid
+
+    flipped = proof.model_copy(update={"directions": ["left" for _ in proof.directions]})
+    assert not verify_proof(flipped).valid
+
+    for copied in (copy.copy(proof), copy.deepcopy(proof), proof.model_copy(deep=True)):
+        assert verify_proof(copied).valid
+
+
+def test_hash_data_uses_canonical_json() -> None:
+    assert hash_data({"vote": "yes", "n": 1}) == hashlib.sha256(b'{"vote":"yes","n":1}').hexdigest()
+    # Non-ASCII stays UTF-8, as with JSON.stringify
+    assert hash_data({"name": "Zoë"}) == hashlib.sha256('{"name":"Zoë"}'.encode()).hexdigest()
+    assert hash_data("plain") == hashlib.sha256(b"plain").hexdigest()
+
+
+def test_verify_proof_rejects_malformed_hashes() -> None:
+    layers = build_tree([_sha256(str(i).encode()) for i in range(4)])
+    proof = make_proof(layers, 0)
+
+    uneven = proof.model_copy(update={"proof": ["aa" * 33, "aa" * 31]})
+    result = verify_proof(uneven)
+    assert not result.valid
+    assert result.error == "Invalid proof hash: must be 64 character hex strings"
+
+    spaced_leaf = proof.model_copy(update={"leaf": " " + "aa" * 31 + " "})
+    result = verify_proof(spaced_leaf)
+    assert not result.valid
+    assert result.error == "Invalid leaf hash: must be 64 character hex string"
+
+    spaced_root = proof.model_copy(update={"root": " " + proof.root[2:] + " "})
+    assert verify_proof(spaced_root).error == "Invalid root hash: must be 64 character hex string"
+
+    non_hex = proof.model_copy(update={"leaf": "zz" * 32})
+    assert verify_proof(non_hex).error == "Invalid hash: leaf, root and proof must be hex strings"
+
+
+def _verified_tree(size: int) -> tuple[list[list[bytes]], Verifier]:
+    """Build a tree and a Verifier that has already accepted every leaf's proof."""
+    layers = build_tree([_sha256(str(i).encode()) for i in range(size)])
+    verifier = Verifier(layers[-1][0].hex())
+    for index in range(size):
+        assert verifier.verify(make_proof(layers, index))
+    return layers, verifier
+
+
+def test_verifier_matches_verify_proof_on_valid_proofs() -> None:
+    layers = build_tree([_sha256(str(i).encode()) for i in range(13)])
+    proofs = [make_proof(layers, index) for index in range(13)]
+    assert verify_proofs(proofs, layers[-1][0].hex()) == [True] * 13
+    assert verify_proofs(proofs, "00" * 32) == [False] * 13
+    assert verify_proofs(proofs, "not hex") == [False] * 13
+
+
+def test_verifier_rejects_tampered_upper_siblings() -> None:
+    layers, verifier = _verified_tree(16)
+    proof = make_proof(layers, 5)
+    for level in range(1, len(proof.proof)):
+        siblings = list(proof.proof)
+        siblings[level] = "33" * 32
+        tampered = proof.model_copy(update={"proof": siblings})
+        assert not verify_proof(tampered).valid
+        assert not verifier.verify(tampered)
+
+
+def test_verifier_rejects_flipped_directions() -> None:
+    layers, verifier = _verified_tree(16)
+    proof = make_proof(layers, 6)
+    for level in range(len(proof.directions)):
+        directions = list(proof.directions)
+        directions[level] = "left" if directions[level] == "right" else "right"
+        flipped = proof.model_copy(update={"directions": directions})
+        assert not verify_proof(flipped).valid
+        assert not verifier.verify(flipped)
+
+
+def test_verifier_handles_duplicate_leaves() -> None:
+    leaf = _sha256(b"same entry")
+    layers = build_tree([leaf] * 7)
+    verifier = Verifier(layers[-1][0].hex())
+    for index in (0, 3, 6, 1, 5, 2, 4):
+        proof = make_proof(layers, index)
+        assert verify_proof(proof).valid
+        assert verifier.verify(proof)
+
+    # A valid path for one position with another position's directions
+    mixed = make_proof(layers, 0).model_copy(
+        update={"directions": make_proof(layers, 1).directions}
+    )
+    assert verifier.verify(mixed) == verify_proof(mixed).valid
+
+
+def test_verifier_interior_node_as_leaf_matches_verify_proof() -> None:
+    layers, verifier = _verified_tree(8)
+    full = make_proof(layers, 4)
+    interior = layers[1][2]  # parent of leaves 4 and 5
+
+    # Interior node with its own (correct) path to the root
+    upper = full.model_copy(
+        update={"leaf": interior.hex(), "proof": full.proof[1:], "directions": full.directions[1:]}
+    )
+    assert verifier.verify(upper) == verify_proof(upper).valid
+
+    # Interior node with a leaf-level path must fail
+    wrong = full.model_copy(update={"leaf": interior.hex()})
+    assert not verify_proof(wrong).valid
+    assert not verifier.verify(wrong)
+
+
+def test_verifier_rejects_malformed_siblings() -> None:
+    layers, verifier = _verified_tree(4)
+    proof = make_proof(layers, 0)
+    assert not verifier.verify(proof.model_copy(update={"proof": ["aa" * 33, "aa" * 31]}))
+    assert not verifier.verify(proof.model_copy(update={"proof": ["zz" * 32, proof.proof[1]]}))
+    assert not verifier.verify(proof.model_copy(update={"directions": ["left"]}))
+
+
+@pytest.mark.parametrize(
+    "directions",
+    [
+        "011",
+        b"011",
+        bytearray(b"011"),
+        [0, 1, 1],
+        (0, 1, 1),
+        [False, True, True],
+        ["left", "right", "right"],
+        ("left", "right", "right"),
+    ],
+)
+def test_merkle_proof_accepts_direction_forms(directions: Any) -> None:
+    fields = {"leaf": "aa" * 32, "index": 0, "proof": ["bb" * 32] * 3, "root": "cc" * 32}
+    proof = MerkleProof(**fields, directions=directions)
+    assert proof.directions == ["left", "right", "right"]
+    assert proof.direction_bits == 0b110
+
+
+@pytest.mark.parametrize("directions", ["", b"", [], ()])
+def test_merkle_proof_accepts_empty_directions(directions: Any) -> None:
+    fields = {"leaf": "aa" * 32, "index": 0, "proof": [], "root": "aa" * 32}
+    assert MerkleProof(**fields, directions=directions).directions == []
+
+
+def test_merkle_proof_rejects_invalid_directions() -> None:
+    fields = {"leaf": "aa" * 32, "index": 0, "proof": ["bb" * 32], "root": "cc" * 32}
+    for directions in ([0, "left"], ["left", 1], [2], "012", ["up"], b"\x00\x01", b"012"):
+        with pytest.raises(ValidationError):
+            MerkleProof(**fields, directions=directions)
@@ -24,10 +24,13 @@ Example:
     >>> print('Entry verified:', verified.valid)
 """
 
-from .client import AsyncVeilChain, VeilChain
+from .client import AsyncVeilChain, VeilChain, get_default_client
 from .types import (
     ApiError,
     AppendEntryResult,
+    BatchAppendResult,
+    BatchEntryResult,
+    BatchSummary,
     CompactProof,
     HistoricalRoot,
     Ledger,
@@ -41,12 +44,14 @@ from .types import (
     VerifyProofResult,
 )
 from .verify import (
+    Verifier,
     hash_data,
     parse_compact_proof,
     to_compact_proof,
     verify_data,
     verify_data_with_proof,
     verify_proof,
+    verify_proofs,
 )
 
 __version__ = "0.1.0"
@@ -55,12 +60,16 @@ __all__ = [
     # Clients
     "VeilChain",
     "AsyncVeilChain",
+    "get_default_client",
     # Types
     "Ledger",
     "LedgerEntry",
     "MerkleProof",
     "CompactProof",
     "AppendEntryResult",
+    "BatchAppendResult",
+    "BatchEntryResult",
+    "BatchSummary",
     "ListEntriesResult",
     "ListLedgersResult",
     "VerifyProofResult",
@@ -71,6 +80,8 @@ __all__ = [
     "VeilChainError",
     # Verification functions
     "verify_proof",
+    "verify_proofs",
+    "Verifier",
     "parse_compact_proof",
     "to_compact_proof",
     "hash_data",
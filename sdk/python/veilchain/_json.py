@@ -0,0 +1,41 @@
+"""VeilChain JSON Helpers.
+
+Uses orjson when it is installed (``pip install veilchain[speedups]``) and
+falls back to the standard library otherwise. Both paths produce compact
+UTF-8 encoded JSON bytes.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes with the standard library."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    dumps = _stdlib_dumps
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON bytes into Python objects."""
+        return json.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects values the stdlib encoder accepts, such as
+            # integers wider than 64 bits, so let json have a go
+            return _stdlib_dumps(obj)
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON bytes into Python objects."""
+        return orjson.loads(data)
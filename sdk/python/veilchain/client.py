@@ -5,17 +5,31 @@ Main client for interacting with the VeilChain API.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import contextlib
+import importlib.util
+import itertools
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator, Sequence
 from typing import Any, TypeVar
 
 import httpx
 
+from . import _json
 from .types import (
+    JSON_OBJECT_ADAPTER,
     AppendEntryResult,
+    BatchAppendResult,
+    BatchSummary,
+    HistoricalRoot,
     Ledger,
     LedgerEntry,
     ListEntriesResult,
     ListLedgersResult,
     MerkleProof,
+    ProofResponse,
     PublicRoot,
     PublicRootsResult,
     VeilChainError,
@@ -25,6 +39,247 @@ from .verify import verify_proof as local_verify_proof
 
 T = TypeVar("T")
 
+# HTTP/2 needs the optional ``h2`` package (``pip install veilchain[http2]``)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _httpx_version() -> tuple[int, ...]:
+    """Return the installed httpx version as a tuple of its numeric parts."""
+    parts = []
+    for part in httpx.__version__.split(".")[:3]:
+        digits = "".join(itertools.takewhile(str.isdigit, part))
+        parts.append(int(digits or 0))
+    return tuple(parts)
+
+
+def _decodable_encodings() -> frozenset[str]:
+    """Content encodings httpx can decode with the packages installed here."""
+    encodings = {"gzip", "deflate"}
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        encodings.add("br")
+    # httpx decodes zstd from 0.27.1 on, when zstandard is installed
+    if importlib.util.find_spec("zstandard") and _httpx_version() >= (0, 27, 1):
+        encodings.add("zstd")
+    return frozenset(encodings)
+
+
+_DECODABLE = _decodable_encodings()
+
+# Response encodings, best first. Brotli and zstd are only advertised when
+# their decoders are installed (``pip install veilchain[compression]``), since
+# httpx passes unknown encodings through undecoded.
+_ACCEPT_ENCODING = ", ".join(
+    encoding for encoding in ("zstd", "br", "gzip", "deflate") if encoding in _DECODABLE
+)
+
+# Success statuses that never carry a response body
+_NO_CONTENT_STATUSES = frozenset((204, 205))
+
+# Exponential backoff delays (seconds) between retries of 5xx responses
+# and transport errors
+_BACKOFFS = (0.1, 0.2, 0.4, 0.8, 1.6)
+
+# Transport errors retried by the request loop (timeouts, dropped or reset
+# connections, a server closing mid-response)
+_RETRYABLE_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+# Connect failures, which the transport of clients built here already retries
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def _build_client(timeout: float, retries: int, pool_size: int) -> httpx.Client:
+    """Create a sync HTTP client with tuned pooling and connect retries."""
+    return httpx.Client(
+        timeout=timeout,
+        transport=httpx.HTTPTransport(
+            limits=_pool_limits(pool_size),
+            http2=_HTTP2_AVAILABLE,
+            retries=retries,
+        ),
+    )
+
+
+def _build_async_client(timeout: float, retries: int, pool_size: int) -> httpx.AsyncClient:
+    """Create an async HTTP client with tuned pooling and connect retries."""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        transport=httpx.AsyncHTTPTransport(
+            limits=_pool_limits(pool_size),
+            http2=_HTTP2_AVAILABLE,
+            retries=retries,
+        ),
+    )
+
+
+_default_client: httpx.Client | None = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> httpx.Client:
+    """Get the process-wide HTTP client for sharing between VeilChain instances.
+
+    The client is created on first use and closed at interpreter exit. Passing
+    it to short-lived clients (scripts, serverless handlers) avoids building a
+    new connection pool each time and reuses open connections.
+
+    Returns:
+        The shared HTTP client
+
+    Example:
+        >>> from veilchain import VeilChain, get_default_client
+        >>> client = VeilChain(base_url='...', client=get_default_client())
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = _build_client(timeout=30.0, retries=3, pool_size=100)
+            atexit.register(_default_client.close)
+        return _default_client
+
+
+def _backoff(attempt: int) -> float:
+    """Get the delay before the next retry attempt."""
+    return _BACKOFFS[min(attempt, len(_BACKOFFS) - 1)]
+
+
+# Largest batch accepted by the batch append endpoint
+_MAX_BATCH_SIZE = 1000
+
+
+def _batch_bodies(
+    entries: Sequence[Any], idempotency_keys: Sequence[str] | None = None
+) -> list[dict[str, Any]]:
+    """Split entries into request bodies for the batch append endpoint."""
+    if idempotency_keys is None:
+        items = [{"data": data} for data in entries]
+    else:
+        if len(idempotency_keys) != len(entries):
+            raise ValueError("idempotency_keys must contain one key per entry")
+        items = [
+            {"data": data, "idempotencyKey": key} for data, key in zip(entries, idempotency_keys)
+        ]
+    return [
+        {"entries": items[i : i + _MAX_BATCH_SIZE]} for i in range(0, len(items), _MAX_BATCH_SIZE)
+    ]
+
+
+def _iter_pages(fetch: Callable[[int], tuple[list[T], int]]) -> Iterator[T]:
+    """Yield items page by page until the reported total is reached.
+
+    ``fetch`` takes an offset and returns the page items and the total count.
+    """
+    offset = 0
+    while True:
+        items, total = fetch(offset)
+        yield from items
+        offset += len(items)
+        if not items or offset >= total:
+            return
+
+
+async def _aiter_pages(
+    fetch: Callable[[int], Coroutine[Any, Any, tuple[list[T], int]]],
+) -> AsyncIterator[T]:
+    """Yield items page by page, fetching the next page in the background.
+
+    The request for page N+1 is in flight while the caller consumes page N,
+    so network time overlaps with processing.
+    """
+    offset = 0
+    task: asyncio.Task[tuple[list[T], int]] | None = asyncio.create_task(fetch(offset))
+    try:
+        while task is not None:
+            items, total = await task
+            offset += len(items)
+            task = asyncio.create_task(fetch(offset)) if items and offset < total else None
+            for item in items:
+                yield item
+    finally:
+        # Stop a prefetch the caller no longer needs and wait for it, so the
+        # request is not left in flight and its error is not left unretrieved
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+
+def _response_error(response: httpx.Response) -> VeilChainError:
+    """Build an SDK error from a failed response, parsing its JSON error body."""
+    try:
+        error_body = _json.loads(response.content) if response.content else {}
+    except ValueError:
+        error_body = {}
+    error_info = error_body.get("error") if isinstance(error_body, dict) else None
+    if not isinstance(error_info, dict):
+        # Not an error envelope (e.g. a rejected batch): keep the body itself
+        return VeilChainError(
+            message=f"HTTP {response.status_code}",
+            status=response.status_code,
+            details=error_body or None,
+        )
+    return VeilChainError(
+        message=error_info.get("message", f"HTTP {response.status_code}"),
+        status=response.status_code,
+        code=error_info.get("code"),
+        details=error_info.get("details"),
+    )
+
+
+def _json_object(data: bytes) -> dict[str, Any] | None:
+    """Parse an untyped JSON object response, or None if it has no body."""
+    return JSON_OBJECT_ADAPTER.validate_json(data) if data else None
+
+
+def _verify_body(proof: MerkleProof) -> bytes:
+    """Encode a verify request body straight from the proof's JSON form."""
+    return b'{"proof":' + proof.model_dump_json().encode("utf-8") + b"}"
+
+
+def _empty_batch_result() -> BatchAppendResult:
+    """Result for a batch append with no entries (nothing is sent)."""
+    return BatchAppendResult(
+        previousRoot=None,
+        newRoot=None,
+        results=[],
+        summary=BatchSummary(total=0, successful=0, failed=0),
+    )
+
+
+def _rejected_batch(error: VeilChainError) -> BatchAppendResult | None:
+    """Get the per-entry results of a batch in which every entry was rejected.
+
+    The batch endpoint answers 400 with a full batch response, rather than an
+    error envelope, when no entry in the batch could be appended.
+    """
+    if error.status == 400 and isinstance(error.details, dict) and "results" in error.details:
+        return BatchAppendResult.model_validate(error.details)
+    return None
+
+
+def _merge_batches(batches: list[BatchAppendResult]) -> BatchAppendResult:
+    """Combine consecutive batch append results into a single result."""
+    if len(batches) == 1:
+        return batches[0]
+    return BatchAppendResult(
+        results=[result for batch in batches for result in batch.results],
+        summary=BatchSummary(
+            total=sum(batch.summary.total for batch in batches),
+            successful=sum(batch.summary.successful for batch in batches),
+            failed=sum(batch.summary.failed for batch in batches),
+        ),
+        previousRoot=batches[0].previous_root,
+        newRoot=batches[-1].new_root,
+    )
+
+
+def _pool_limits(pool_size: int) -> httpx.Limits:
+    """Build connection pool limits sized for concurrent fan-out."""
+    return httpx.Limits(
+        max_keepalive_connections=pool_size,
+        max_connections=pool_size * 2,
+        keepalive_expiry=30.0,
+    )
+
 
 class VeilChain:
     """VeilChain SDK Client.
@@ -54,6 +309,9 @@ class VeilChain:
         token: str | None = None,
         timeout: float = 30.0,
         retries: int = 3,
+        pool_size: int = 100,
+        client: httpx.Client | None = None,
+        warm: bool = False,
     ) -> None:
         """Initialize the VeilChain client.
 
@@ -62,14 +320,28 @@ class VeilChain:
             api_key: API key for authentication
             token: JWT token for authentication
             timeout: Request timeout in seconds
-            retries: Number of retry attempts for failed requests
+            retries: Number of retry attempts for failed requests. 5xx
+                responses, timeouts and network errors are retried with
+                exponential backoff; 4xx responses are not retried.
+            pool_size: Maximum number of idle keep-alive connections
+            client: Existing HTTP client to use instead of creating one. It is
+                not closed by close(); timeout and pool_size do not apply.
+            warm: Open a connection in the background so the first request
+                does not pay the TCP/TLS handshake
         """
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
-        self.token = token
+        self._api_key = api_key
+        self._token = token
         self.timeout = timeout
         self.retries = retries
-        self._client = httpx.Client(timeout=timeout)
+        self._rebuild_headers()
+        self._owns_client = client is None
+        # Clients built here (and the shared default client) already retry
+        # connect failures in their transport
+        self._connect_retried = client is None or client is _default_client
+        self._client = client if client is not None else _build_client(timeout, retries, pool_size)
+        if warm:
+            threading.Thread(target=self._warm_up, daemon=True).start()
 
     def __enter__(self) -> VeilChain:
         return self
@@ -78,55 +350,92 @@ class VeilChain:
         self.close()
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _get_headers(self, skip_auth: bool = False) -> dict[str, str]:
-        """Get request headers."""
-        headers = {
+        """Close the HTTP client (unless it was provided by the caller)."""
+        if self._owns_client:
+            self._client.close()
+
+    def _warm_up(self) -> None:
+        """Open a pooled connection ahead of the first real request."""
+        with contextlib.suppress(Exception):
+            self.health()
+
+    @property
+    def token(self) -> str | None:
+        """JWT token used for authentication."""
+        return self._token
+
+    @token.setter
+    def token(self, token: str | None) -> None:
+        self._token = token
+        self._rebuild_headers()
+
+    @property
+    def api_key(self) -> str | None:
+        """API key used for authentication (when no token is set)."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str | None) -> None:
+        self._api_key = api_key
+        self._rebuild_headers()
+
+    def _rebuild_headers(self) -> None:
+        """Rebuild the cached request headers after a credential change."""
+        self._headers_noauth = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
         }
-        if not skip_auth:
-            if self.token:
-                headers["Authorization"] = f"Bearer {self.token}"
-            elif self.api_key:
-                headers["X-API-Key"] = self.api_key
-        return headers
+        self._headers_auth = dict(self._headers_noauth)
+        if self._token:
+            self._headers_auth["Authorization"] = f"Bearer {self._token}"
+        elif self._api_key:
+            self._headers_auth["X-API-Key"] = self._api_key
+
+    def _get_headers(self, skip_auth: bool = False) -> dict[str, str]:
+        """Get request headers."""
+        return self._headers_noauth if skip_auth else self._headers_auth
 
     def _request(
         self,
         method: str,
-        path: str,
+        url: str,
+        *,
         body: Any | None = None,
+        content: bytes | None = None,
+        params: dict[str, Any] | None = None,
         skip_auth: bool = False,
-    ) -> Any:
-        """Make an authenticated API request."""
-        url = f"{self.base_url}{path}"
+        retry: bool = True,
+    ) -> bytes:
+        """Make an authenticated API request and return the raw response body.
+
+        ``url`` is the full request URL, built by the caller in a single
+        f-string. ``body`` is JSON-encoded; ``content`` is sent as-is when the
+        caller already holds the encoded body. ``retry=False`` makes a single
+        attempt, for requests that are unsafe to repeat.
+        """
         headers = self._get_headers(skip_auth)
+        if body is not None:
+            content = _json.dumps(body)
 
         last_error: Exception | None = None
 
-        for attempt in range(self.retries + 1):
+        attempts = self.retries + 1 if retry else 1
+        for attempt in range(attempts):
             try:
                 response = self._client.request(
                     method=method,
                     url=url,
                     headers=headers,
-                    json=body,
+                    params=params,
+                    content=content,
                 )
 
-                if not response.is_success:
-                    error_body = response.json() if response.content else {}
-                    error_info = error_body.get("error", {})
-                    raise VeilChainError(
-                        message=error_info.get("message", f"HTTP {response.status_code}"),
-                        status=response.status_code,
-                        code=error_info.get("code"),
-                        details=error_info.get("details"),
-                    )
-
-                return response.json() if response.content else None
+                if response.status_code in _NO_CONTENT_STATUSES:
+                    return b""
+                if response.is_success:
+                    return response.content
+                raise _response_error(response)
 
             except VeilChainError as e:
                 # Don't retry on client errors (4xx)
@@ -134,14 +443,14 @@ class VeilChain:
                     raise
                 last_error = e
 
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
+                if self._connect_retried and isinstance(e, _CONNECT_ERRORS):
+                    raise
                 last_error = e
 
             # Wait before retry with exponential backoff
-            if attempt < self.retries:
-                import time
-
-                time.sleep(2**attempt * 0.1)
+            if attempt + 1 < attempts:
+                time.sleep(_backoff(attempt))
 
         if last_error:
             raise last_error
@@ -179,8 +488,8 @@ class VeilChain:
         if schema:
             body["schema"] = schema
 
-        data = self._request("POST", "/v1/ledgers", body)
-        return Ledger.model_validate(data)
+        data = self._request("POST", f"{self.base_url}/v1/ledgers", body=body)
+        return Ledger.model_validate_json(data)
 
     def get_ledger(self, ledger_id: str) -> Ledger | None:
         """Get a ledger by ID.
@@ -192,8 +501,8 @@ class VeilChain:
             The ledger metadata or None if not found
         """
         try:
-            data = self._request("GET", f"/v1/ledgers/{ledger_id}")
-            return Ledger.model_validate(data)
+            data = self._request("GET", f"{self.base_url}/v1/ledgers/{ledger_id}")
+            return Ledger.model_validate_json(data)
         except VeilChainError as e:
             if e.status == 404:
                 return None
@@ -213,9 +522,26 @@ class VeilChain:
         Returns:
             Paginated list of ledgers
         """
-        params = f"?offset={offset}&limit={limit}"
-        data = self._request("GET", f"/v1/ledgers{params}")
-        return ListLedgersResult.model_validate(data)
+        data = self._request(
+            "GET", f"{self.base_url}/v1/ledgers", params={"offset": offset, "limit": limit}
+        )
+        return ListLedgersResult.model_validate_json(data)
+
+    def iter_ledgers(self, page_size: int = 500) -> Iterator[Ledger]:
+        """Iterate over all ledgers, fetching them page by page.
+
+        Args:
+            page_size: Number of ledgers to request per page
+
+        Returns:
+            Iterator over every ledger
+        """
+
+        def fetch(offset: int) -> tuple[list[Ledger], int]:
+            page = self.list_ledgers(offset=offset, limit=page_size)
+            return page.ledgers, page.total
+
+        return _iter_pages(fetch)
 
     def delete_ledger(self, ledger_id: str) -> None:
         """Delete a ledger (soft delete).
@@ -223,7 +549,7 @@ class VeilChain:
         Args:
             ledger_id: The ledger ID to delete
         """
-        self._request("DELETE", f"/v1/ledgers/{ledger_id}")
+        self._request("DELETE", f"{self.base_url}/v1/ledgers/{ledger_id}")
 
     # ============================================================
     # Entry Operations
@@ -262,8 +588,72 @@ class VeilChain:
         if metadata:
             body["metadata"] = metadata
 
-        response = self._request("POST", f"/v1/ledgers/{ledger_id}/entries", body)
-        return AppendEntryResult.model_validate(response)
+        response = self._request(
+            "POST", f"{self.base_url}/v1/ledgers/{ledger_id}/entries", body=body
+        )
+        return AppendEntryResult.model_validate_json(response)
+
+    def append_entries(
+        self,
+        ledger_id: str,
+        entries: Sequence[Any],
+        idempotency_keys: Sequence[str] | None = None,
+    ) -> BatchAppendResult:
+        """Append many entries to a ledger in as few requests as possible.
+
+        Entries are sent to the batch endpoint (up to 1000 per request) and
+        appended in order, so a large import costs one round trip per batch
+        instead of one per entry. Entries the server rejects are reported in
+        the results, even when a whole batch is rejected; the others remain
+        committed.
+
+        The server appends a batch one entry at a time, so re-sending a batch
+        that failed partway could append some entries twice. Batch requests
+        are therefore only retried (on 5xx responses and network errors) when
+        ``idempotency_keys`` are given; entries already appended are then
+        answered from the server's idempotency cache instead.
+
+        More than 1000 entries are sent as several requests, one after
+        another. If a later request fails for any other reason than rejected
+        entries, its exception is raised and the results of the earlier
+        batches are not returned, although those entries are committed. With
+        ``idempotency_keys`` the whole call can simply be repeated.
+
+        Args:
+            ledger_id: The target ledger ID
+            entries: The entry data values, in append order
+            idempotency_keys: One idempotency key per entry (optional)
+
+        Returns:
+            Per-entry results with the root hashes before and after (an empty
+            result, with no request made, when ``entries`` is empty)
+
+        Raises:
+            ValueError: If idempotency_keys does not have one key per entry
+
+        Example:
+            >>> result = client.append_entries('ledger-123', [
+            ...     {'vote': 'yes'},
+            ...     {'vote': 'no'},
+            ... ])
+            >>> print(result.summary.successful, result.new_root)
+        """
+        if not entries:
+            return _empty_batch_result()
+        url = f"{self.base_url}/v1/ledgers/{ledger_id}/entries/batch"
+        retry = idempotency_keys is not None
+        batches = []
+        for body in _batch_bodies(entries, idempotency_keys):
+            try:
+                data = self._request("POST", url, body=body, retry=retry)
+            except VeilChainError as e:
+                rejected = _rejected_batch(e)
+                if rejected is None:
+                    raise
+                batches.append(rejected)
+                continue
+            batches.append(BatchAppendResult.model_validate_json(data))
+        return _merge_batches(batches)
 
     def get_entry(
         self,
@@ -282,9 +672,11 @@ class VeilChain:
             The entry or None if not found
         """
         try:
-            params = "?proof=true" if include_proof else ""
-            data = self._request("GET", f"/v1/ledgers/{ledger_id}/entries/{entry_id}{params}")
-            return LedgerEntry.model_validate(data)
+            params = {"proof": "true"} if include_proof else None
+            data = self._request(
+                "GET", f"{self.base_url}/v1/ledgers/{ledger_id}/entries/{entry_id}", params=params
+            )
+            return LedgerEntry.model_validate_json(data)
         except VeilChainError as e:
             if e.status == 404:
                 return None
@@ -306,9 +698,33 @@ class VeilChain:
         Returns:
             Paginated list of entries
         """
-        params = f"?offset={offset}&limit={limit}"
-        data = self._request("GET", f"/v1/ledgers/{ledger_id}/entries{params}")
-        return ListEntriesResult.model_validate(data)
+        data = self._request(
+            "GET",
+            f"{self.base_url}/v1/ledgers/{ledger_id}/entries",
+            params={"offset": offset, "limit": limit},
+        )
+        return ListEntriesResult.model_validate_json(data)
+
+    def iter_entries(self, ledger_id: str, page_size: int = 500) -> Iterator[LedgerEntry]:
+        """Iterate over all entries in a ledger, fetching them page by page.
+
+        Args:
+            ledger_id: The ledger ID
+            page_size: Number of entries to request per page
+
+        Returns:
+            Iterator over every entry, in ledger order
+
+        Example:
+            >>> for entry in client.iter_entries('ledger-123'):
+            ...     print(entry.id, entry.hash)
+        """
+
+        def fetch(offset: int) -> tuple[list[LedgerEntry], int]:
+            page = self.list_entries(ledger_id, offset=offset, limit=page_size)
+            return page.entries, int(page.total)
+
+        return _iter_pages(fetch)
 
     # ============================================================
     # Proof Operations
@@ -324,8 +740,8 @@ class VeilChain:
         Returns:
             The Merkle proof
         """
-        data = self._request("GET", f"/v1/ledgers/{ledger_id}/proof/{entry_id}")
-        return MerkleProof.model_validate(data["proof"])
+        data = self._request("GET", f"{self.base_url}/v1/ledgers/{ledger_id}/proof/{entry_id}")
+        return ProofResponse.model_validate_json(data).proof
 
     def verify_proof_local(self, proof: MerkleProof) -> VerifyProofResult:
         """Verify a proof locally (offline).
@@ -349,8 +765,8 @@ class VeilChain:
         Returns:
             Verification result
         """
-        data = self._request("POST", "/v1/verify", {"proof": proof.model_dump()})
-        return VerifyProofResult.model_validate(data)
+        data = self._request("POST", f"{self.base_url}/v1/verify", content=_verify_body(proof))
+        return VerifyProofResult.model_validate_json(data)
 
     # ============================================================
     # Public (Unauthenticated) Operations
@@ -369,9 +785,9 @@ class VeilChain:
             The current root information
         """
         data = self._request(
-            "GET", f"/v1/public/ledgers/{ledger_id}/root", skip_auth=True
+            "GET", f"{self.base_url}/v1/public/ledgers/{ledger_id}/root", skip_auth=True
         )
-        return PublicRoot.model_validate(data)
+        return PublicRoot.model_validate_json(data)
 
     def get_public_roots(
         self,
@@ -389,11 +805,30 @@ class VeilChain:
         Returns:
             Paginated list of historical roots
         """
-        params = f"?offset={offset}&limit={limit}"
         data = self._request(
-            "GET", f"/v1/public/ledgers/{ledger_id}/roots{params}", skip_auth=True
+            "GET",
+            f"{self.base_url}/v1/public/ledgers/{ledger_id}/roots",
+            params={"offset": offset, "limit": limit},
+            skip_auth=True,
         )
-        return PublicRootsResult.model_validate(data)
+        return PublicRootsResult.model_validate_json(data)
+
+    def iter_public_roots(self, ledger_id: str, page_size: int = 500) -> Iterator[HistoricalRoot]:
+        """Iterate over all historical root hashes (public, no auth required).
+
+        Args:
+            ledger_id: The ledger ID
+            page_size: Number of roots to request per page
+
+        Returns:
+            Iterator over every historical root
+        """
+
+        def fetch(offset: int) -> tuple[list[HistoricalRoot], int]:
+            page = self.get_public_roots(ledger_id, offset=offset, limit=page_size)
+            return page.roots, page.total
+
+        return _iter_pages(fetch)
 
     def verify_public(self, proof: MerkleProof) -> VerifyProofResult:
         """Verify a proof via the public API (no auth required).
@@ -405,32 +840,34 @@ class VeilChain:
             Verification result
         """
         data = self._request(
-            "POST", "/v1/public/verify", {"proof": proof.model_dump()}, skip_auth=True
+            "POST", f"{self.base_url}/v1/public/verify", content=_verify_body(proof), skip_auth=True
         )
-        return VerifyProofResult.model_validate(data)
+        return VerifyProofResult.model_validate_json(data)
 
     # ============================================================
     # Utility Methods
     # ============================================================
 
-    def get_current_root(self, ledger_id: str) -> dict[str, str]:
+    def get_current_root(self, ledger_id: str) -> dict[str, str] | None:
         """Get the current root hash of a ledger.
 
         Args:
             ledger_id: The ledger ID
 
         Returns:
-            The current root hash and entry count
+            The current root hash and entry count (None if the response is empty)
         """
-        return self._request("GET", f"/v1/ledgers/{ledger_id}/root")
+        data = self._request("GET", f"{self.base_url}/v1/ledgers/{ledger_id}/root")
+        return _json_object(data)
 
-    def health(self) -> dict[str, str]:
+    def health(self) -> dict[str, str] | None:
         """Health check.
 
         Returns:
-            API health status
+            API health status (None if the response is empty)
         """
-        return self._request("GET", "/health", skip_auth=True)
+        data = self._request("GET", f"{self.base_url}/health", skip_auth=True)
+        return _json_object(data)
 
     def set_token(self, token: str) -> None:
         """Update authentication token.
@@ -474,84 +911,169 @@ class AsyncVeilChain:
         token: str | None = None,
         timeout: float = 30.0,
         retries: int = 3,
+        pool_size: int = 100,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 100,
+        warm: bool = False,
     ) -> None:
-        """Initialize the async VeilChain client."""
+        """Initialize the async VeilChain client.
+
+        With the ``http2`` extra installed, concurrent requests are multiplexed
+        over a single connection instead of opening one socket per coroutine.
+        An injected ``client`` (e.g. one shared on ``app.state``) is not closed
+        by close(). At most ``max_concurrency`` requests are in flight at once;
+        further calls wait for a free slot instead of flooding the server.
+        With ``warm=True`` a connection is opened in the background as soon as
+        an event loop is running (at construction or on ``async with``).
+        Up to ``retries`` retries are made for 5xx responses, timeouts and
+        network errors, with exponential backoff; 4xx responses are not retried.
+        """
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
-        self.token = token
+        self._api_key = api_key
+        self._token = token
         self.timeout = timeout
         self.retries = retries
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self.max_concurrency = max_concurrency
+        # Created on first request so it binds to the running event loop
+        self._semaphore: asyncio.Semaphore | None = None
+        self._rebuild_headers()
+        self._owns_client = client is None
+        # Clients built here already retry connect failures in their transport
+        self._connect_retried = client is None
+        self._client = (
+            client if client is not None else _build_async_client(timeout, retries, pool_size)
+        )
+        self._warm = warm
+        self._warm_task: asyncio.Task[None] | None = None
+        if warm:
+            self._schedule_warm_up()
 
     async def __aenter__(self) -> AsyncVeilChain:
+        if self._warm:
+            self._schedule_warm_up()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
-
-    def _get_headers(self, skip_auth: bool = False) -> dict[str, str]:
-        """Get request headers."""
-        headers = {
+        """Close the HTTP client (unless it was provided by the caller)."""
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._warm_task
+        if self._owns_client:
+            await self._client.aclose()
+
+    def _schedule_warm_up(self) -> None:
+        """Start the warm-up request if an event loop is running."""
+        if self._warm_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._warm_task = loop.create_task(self._warm_up())
+
+    async def _warm_up(self) -> None:
+        """Open a pooled connection ahead of the first real request."""
+        with contextlib.suppress(Exception):
+            await self.health()
+
+    @property
+    def token(self) -> str | None:
+        """JWT token used for authentication."""
+        return self._token
+
+    @token.setter
+    def token(self, token: str | None) -> None:
+        self._token = token
+        self._rebuild_headers()
+
+    @property
+    def api_key(self) -> str | None:
+        """API key used for authentication (when no token is set)."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str | None) -> None:
+        self._api_key = api_key
+        self._rebuild_headers()
+
+    def _rebuild_headers(self) -> None:
+        """Rebuild the cached request headers after a credential change."""
+        self._headers_noauth = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
         }
-        if not skip_auth:
-            if self.token:
-                headers["Authorization"] = f"Bearer {self.token}"
-            elif self.api_key:
-                headers["X-API-Key"] = self.api_key
-        return headers
+        self._headers_auth = dict(self._headers_noauth)
+        if self._token:
+            self._headers_auth["Authorization"] = f"Bearer {self._token}"
+        elif self._api_key:
+            self._headers_auth["X-API-Key"] = self._api_key
+
+    def _get_headers(self, skip_auth: bool = False) -> dict[str, str]:
+        """Get request headers."""
+        return self._headers_noauth if skip_auth else self._headers_auth
 
     async def _request(
         self,
         method: str,
-        path: str,
+        url: str,
+        *,
         body: Any | None = None,
+        content: bytes | None = None,
+        params: dict[str, Any] | None = None,
         skip_auth: bool = False,
-    ) -> Any:
-        """Make an authenticated API request."""
-        import asyncio
-
-        url = f"{self.base_url}{path}"
+        retry: bool = True,
+    ) -> bytes:
+        """Make an authenticated API request and return the raw response body.
+
+        ``url`` is the full request URL, built by the caller in a single
+        f-string. ``body`` is JSON-encoded; ``content`` is sent as-is when the
+        caller already holds the encoded body. ``retry=False`` makes a single
+        attempt, for requests that are unsafe to repeat.
+        """
         headers = self._get_headers(skip_auth)
+        if body is not None:
+            content = _json.dumps(body)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
 
         last_error: Exception | None = None
 
-        for attempt in range(self.retries + 1):
+        attempts = self.retries + 1 if retry else 1
+        for attempt in range(attempts):
             try:
-                response = await self._client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=body,
-                )
-
-                if not response.is_success:
-                    error_body = response.json() if response.content else {}
-                    error_info = error_body.get("error", {})
-                    raise VeilChainError(
-                        message=error_info.get("message", f"HTTP {response.status_code}"),
-                        status=response.status_code,
-                        code=error_info.get("code"),
-                        details=error_info.get("details"),
+                async with self._semaphore:
+                    response = await self._client.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        params=params,
+                        content=content,
                     )
 
-                return response.json() if response.content else None
+                if response.status_code in _NO_CONTENT_STATUSES:
+                    return b""
+                if response.is_success:
+                    return response.content
+                raise _response_error(response)
 
             except VeilChainError as e:
                 if e.status and 400 <= e.status < 500:
                     raise
                 last_error = e
 
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
+                if self._connect_retried and isinstance(e, _CONNECT_ERRORS):
+                    raise
                 last_error = e
 
-            if attempt < self.retries:
-                await asyncio.sleep(2**attempt * 0.1)
+            if attempt + 1 < attempts:
+                await asyncio.sleep(_backoff(attempt))
 
         if last_error:
             raise last_error
@@ -570,14 +1092,14 @@ class AsyncVeilChain:
             body["description"] = description
         if schema:
             body["schema"] = schema
-        data = await self._request("POST", "/v1/ledgers", body)
-        return Ledger.model_validate(data)
+        data = await self._request("POST", f"{self.base_url}/v1/ledgers", body=body)
+        return Ledger.model_validate_json(data)
 
     async def get_ledger(self, ledger_id: str) -> Ledger | None:
         """Get a ledger by ID."""
         try:
-            data = await self._request("GET", f"/v1/ledgers/{ledger_id}")
-            return Ledger.model_validate(data)
+            data = await self._request("GET", f"{self.base_url}/v1/ledgers/{ledger_id}")
+            return Ledger.model_validate_json(data)
         except VeilChainError as e:
             if e.status == 404:
                 return None
@@ -585,13 +1107,23 @@ class AsyncVeilChain:
 
     async def list_ledgers(self, offset: int = 0, limit: int = 100) -> ListLedgersResult:
         """List all ledgers."""
-        params = f"?offset={offset}&limit={limit}"
-        data = await self._request("GET", f"/v1/ledgers{params}")
-        return ListLedgersResult.model_validate(data)
+        data = await self._request(
+            "GET", f"{self.base_url}/v1/ledgers", params={"offset": offset, "limit": limit}
+        )
+        return ListLedgersResult.model_validate_json(data)
+
+    def iter_ledgers(self, page_size: int = 500) -> AsyncIterator[Ledger]:
+        """Iterate over all ledgers, prefetching the next page."""
+
+        async def fetch(offset: int) -> tuple[list[Ledger], int]:
+            page = await self.list_ledgers(offset=offset, limit=page_size)
+            return page.ledgers, page.total
+
+        return _aiter_pages(fetch)
 
     async def delete_ledger(self, ledger_id: str) -> None:
         """Delete a ledger."""
-        await self._request("DELETE", f"/v1/ledgers/{ledger_id}")
+        await self._request("DELETE", f"{self.base_url}/v1/ledgers/{ledger_id}")
 
     async def append_entry(
         self,
@@ -606,8 +1138,37 @@ class AsyncVeilChain:
             body["idempotencyKey"] = idempotency_key
         if metadata:
             body["metadata"] = metadata
-        response = await self._request("POST", f"/v1/ledgers/{ledger_id}/entries", body)
-        return AppendEntryResult.model_validate(response)
+        response = await self._request(
+            "POST", f"{self.base_url}/v1/ledgers/{ledger_id}/entries", body=body
+        )
+        return AppendEntryResult.model_validate_json(response)
+
+    async def append_entries(
+        self,
+        ledger_id: str,
+        entries: Sequence[Any],
+        idempotency_keys: Sequence[str] | None = None,
+    ) -> BatchAppendResult:
+        """Append many entries to a ledger in as few requests as possible.
+
+        See VeilChain.append_entries for retry and partial-failure behavior.
+        """
+        if not entries:
+            return _empty_batch_result()
+        url = f"{self.base_url}/v1/ledgers/{ledger_id}/entries/batch"
+        retry = idempotency_keys is not None
+        batches = []
+        for body in _batch_bodies(entries, idempotency_keys):
+            try:
+                data = await self._request("POST", url, body=body, retry=retry)
+            except VeilChainError as e:
+                rejected = _rejected_batch(e)
+                if rejected is None:
+                    raise
+                batches.append(rejected)
+                continue
+            batches.append(BatchAppendResult.model_validate_json(data))
+        return _merge_batches(batches)
 
     async def get_entry(
         self,
@@ -617,11 +1178,11 @@ class AsyncVeilChain:
     ) -> LedgerEntry | None:
         """Get an entry by ID."""
         try:
-            params = "?proof=true" if include_proof else ""
+            params = {"proof": "true"} if include_proof else None
             data = await self._request(
-                "GET", f"/v1/ledgers/{ledger_id}/entries/{entry_id}{params}"
+                "GET", f"{self.base_url}/v1/ledgers/{ledger_id}/entries/{entry_id}", params=params
             )
-            return LedgerEntry.model_validate(data)
+            return LedgerEntry.model_validate_json(data)
         except VeilChainError as e:
             if e.status == 404:
                 return None
@@ -631,14 +1192,28 @@ class AsyncVeilChain:
         self, ledger_id: str, offset: int = 0, limit: int = 100
     ) -> ListEntriesResult:
         """List entries in a ledger."""
-        params = f"?offset={offset}&limit={limit}"
-        data = await self._request("GET", f"/v1/ledgers/{ledger_id}/entries{params}")
-        return ListEntriesResult.model_validate(data)
+        data = await self._request(
+            "GET",
+            f"{self.base_url}/v1/ledgers/{ledger_id}/entries",
+            params={"offset": offset, "limit": limit},
+        )
+        return ListEntriesResult.model_validate_json(data)
+
+    def iter_entries(self, ledger_id: str, page_size: int = 500) -> AsyncIterator[LedgerEntry]:
+        """Iterate over all entries in a ledger, prefetching the next page."""
+
+        async def fetch(offset: int) -> tuple[list[LedgerEntry], int]:
+            page = await self.list_entries(ledger_id, offset=offset, limit=page_size)
+            return page.entries, int(page.total)
+
+        return _aiter_pages(fetch)
 
     async def get_proof(self, ledger_id: str, entry_id: str) -> MerkleProof:
         """Get an inclusion proof for an entry."""
-        data = await self._request("GET", f"/v1/ledgers/{ledger_id}/proof/{entry_id}")
-        return MerkleProof.model_validate(data["proof"])
+        data = await self._request(
+            "GET", f"{self.base_url}/v1/ledgers/{ledger_id}/proof/{entry_id}"
+        )
+        return ProofResponse.model_validate_json(data).proof
 
     def verify_proof_local(self, proof: MerkleProof) -> VerifyProofResult:
         """Verify a proof locally (offline)."""
@@ -646,40 +1221,57 @@ class AsyncVeilChain:
 
     async def verify_proof(self, proof: MerkleProof) -> VerifyProofResult:
         """Verify a proof via the API."""
-        data = await self._request("POST", "/v1/verify", {"proof": proof.model_dump()})
-        return VerifyProofResult.model_validate(data)
+        data = await self._request(
+            "POST", f"{self.base_url}/v1/verify", content=_verify_body(proof)
+        )
+        return VerifyProofResult.model_validate_json(data)
 
     async def get_public_root(self, ledger_id: str) -> PublicRoot:
         """Get the current root hash (public)."""
         data = await self._request(
-            "GET", f"/v1/public/ledgers/{ledger_id}/root", skip_auth=True
+            "GET", f"{self.base_url}/v1/public/ledgers/{ledger_id}/root", skip_auth=True
         )
-        return PublicRoot.model_validate(data)
+        return PublicRoot.model_validate_json(data)
 
     async def get_public_roots(
         self, ledger_id: str, offset: int = 0, limit: int = 100
     ) -> PublicRootsResult:
         """Get historical roots (public)."""
-        params = f"?offset={offset}&limit={limit}"
         data = await self._request(
-            "GET", f"/v1/public/ledgers/{ledger_id}/roots{params}", skip_auth=True
+            "GET",
+            f"{self.base_url}/v1/public/ledgers/{ledger_id}/roots",
+            params={"offset": offset, "limit": limit},
+            skip_auth=True,
         )
-        return PublicRootsResult.model_validate(data)
+        return PublicRootsResult.model_validate_json(data)
+
+    def iter_public_roots(
+        self, ledger_id: str, page_size: int = 500
+    ) -> AsyncIterator[HistoricalRoot]:
+        """Iterate over all historical roots (public), prefetching the next page."""
+
+        async def fetch(offset: int) -> tuple[list[HistoricalRoot], int]:
+            page = await self.get_public_roots(ledger_id, offset=offset, limit=page_size)
+            return page.roots, page.total
+
+        return _aiter_pages(fetch)
 
     async def verify_public(self, proof: MerkleProof) -> VerifyProofResult:
         """Verify a proof via public API."""
         data = await self._request(
-            "POST", "/v1/public/verify", {"proof": proof.model_dump()}, skip_auth=True
+            "POST", f"{self.base_url}/v1/public/verify", content=_verify_body(proof), skip_auth=True
         )
-        return VerifyProofResult.model_validate(data)
+        return VerifyProofResult.model_validate_json(data)
 
-    async def get_current_root(self, ledger_id: str) -> dict[str, str]:
+    async def get_current_root(self, ledger_id: str) -> dict[str, str] | None:
         """Get the current root hash."""
-        return await self._request("GET", f"/v1/ledgers/{ledger_id}/root")
+        data = await self._request("GET", f"{self.base_url}/v1/ledgers/{ledger_id}/root")
+        return _json_object(data)
 
-    async def health(self) -> dict[str, str]:
+    async def health(self) -> dict[str, str] | None:
         """Health check."""
-        return await self._request("GET", "/health", skip_auth=True)
+        data = await self._request("GET", f"{self.base_url}/health", skip_auth=True)
+        return _json_object(data)
 
     def set_token(self, token: str) -> None:
         """Update authentication token."""
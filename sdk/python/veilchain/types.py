@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+# Shared model settings: accept field names or aliases, immutable instances,
+# and unknown API fields are dropped rather than stored
+_MODEL_CONFIG = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")
+
+# Direction names keyed by compact bit character code ('0' = left, '1' = right)
+_DIRECTION_NAMES: dict[int, str] = {0x30: "left", 0x31: "right"}
+
+# MerkleProof cached_property names; their values live in the instance __dict__
+_DECODED_ATTRS = ("direction_bits", "leaf_bytes", "root_bytes", "proof_bytes")
 
 
 class MerkleProof(BaseModel):
     """Merkle proof for inclusion verification."""
 
+    model_config = _MODEL_CONFIG
+
     leaf: str = Field(..., description="The hash of the leaf (entry) being proven")
     index: int = Field(..., description="The position/index of the entry in the tree")
     proof: list[str] = Field(..., description="Array of sibling hashes for the proof path")
@@ -19,10 +32,64 @@ class MerkleProof(BaseModel):
     )
     root: str = Field(..., description="The root hash of the Merkle tree")
 
+    @field_validator("directions", mode="before")
+    @classmethod
+    def _expand_direction_bits(cls, value: Any) -> Any:
+        """Accept directions as compact bits ('0101', b'0101' or 0/1 values) as well as names."""
+        if isinstance(value, (str, bytes, bytearray)):
+            bits = value.encode() if isinstance(value, str) else value
+            if bits.strip(b"01"):
+                return value
+            return [_DIRECTION_NAMES[bit] for bit in bits]
+        if isinstance(value, (list, tuple)) and all(isinstance(bit, int) for bit in value):
+            return [_DIRECTION_NAMES.get(bit + 0x30, bit) for bit in value]
+        # Anything else (names, or a mix of names and bits) is left for pydantic
+        # to validate and report
+        return value
+
+    # Decoded forms, computed on first access and cached (not serialized).
+    # pydantic copies the instance __dict__ in model_copy, copy and deepcopy,
+    # so copies drop the cached values and decode their own (possibly updated)
+    # fields again.
+
+    def __copy__(self) -> MerkleProof:
+        copied = super().__copy__()
+        for name in _DECODED_ATTRS:
+            copied.__dict__.pop(name, None)
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> MerkleProof:
+        copied = super().__deepcopy__(memo)
+        for name in _DECODED_ATTRS:
+            copied.__dict__.pop(name, None)
+        return copied
+
+    @cached_property
+    def direction_bits(self) -> int:
+        """The directions as a bitmask: bit i is set when sibling i is on the right."""
+        return sum(1 << i for i, direction in enumerate(self.directions) if direction == "right")
+
+    @cached_property
+    def leaf_bytes(self) -> bytes:
+        """The leaf hash as raw bytes."""
+        return bytes.fromhex(self.leaf)
+
+    @cached_property
+    def root_bytes(self) -> bytes:
+        """The root hash as raw bytes."""
+        return bytes.fromhex(self.root)
+
+    @cached_property
+    def proof_bytes(self) -> tuple[bytes, ...]:
+        """The sibling hashes as raw bytes."""
+        return tuple(map(bytes.fromhex, self.proof))
+
 
 class CompactProof(BaseModel):
     """Compact proof format for efficient storage/transmission."""
 
+    model_config = _MODEL_CONFIG
+
     v: int = Field(..., description="Version number")
     l: str = Field(..., description="Leaf hash")
     r: str = Field(..., description="Root hash")
@@ -34,6 +101,8 @@ class CompactProof(BaseModel):
 class Ledger(BaseModel):
     """Ledger metadata."""
 
+    model_config = _MODEL_CONFIG
+
     id: str = Field(..., description="Unique ledger identifier")
     name: str = Field(..., description="Human-readable name")
     description: str | None = Field(None, description="Optional description")
@@ -47,13 +116,12 @@ class Ledger(BaseModel):
         None, alias="schema", description="Optional JSON Schema for entry validation"
     )
 
-    class Config:
-        populate_by_name = True
-
 
 class LedgerEntry(BaseModel):
     """Ledger entry."""
 
+    model_config = _MODEL_CONFIG
+
     id: str = Field(..., description="Unique entry identifier")
     position: str = Field(..., description="Position in the ledger (0-indexed)")
     data: Any = Field(..., description="Entry data")
@@ -61,25 +129,59 @@ class LedgerEntry(BaseModel):
     created_at: str = Field(..., alias="createdAt", description="Creation timestamp (ISO 8601)")
     proof: MerkleProof | None = Field(None, description="Inclusion proof (if requested)")
 
-    class Config:
-        populate_by_name = True
-
 
 class AppendEntryResult(BaseModel):
     """Result of appending an entry."""
 
+    model_config = _MODEL_CONFIG
+
     entry: LedgerEntry = Field(..., description="The created entry")
     proof: MerkleProof = Field(..., description="Inclusion proof for the entry")
     previous_root: str = Field(..., alias="previousRoot", description="Root hash before append")
     new_root: str = Field(..., alias="newRoot", description="Root hash after append")
 
-    class Config:
-        populate_by_name = True
+
+class BatchEntryResult(BaseModel):
+    """Outcome of a single entry in a batch append."""
+
+    model_config = _MODEL_CONFIG
+
+    success: bool = Field(..., description="Whether the entry was appended")
+    entry: LedgerEntry | None = Field(None, description="The created entry (on success)")
+    proof: MerkleProof | None = Field(None, description="Inclusion proof (on success)")
+    error: ApiError | None = Field(None, description="Error details (on failure)")
+
+
+class BatchSummary(BaseModel):
+    """Counts for a batch append."""
+
+    model_config = _MODEL_CONFIG
+
+    total: int = Field(..., description="Number of entries submitted")
+    successful: int = Field(..., description="Number of entries appended")
+    failed: int = Field(..., description="Number of entries rejected")
+
+
+class BatchAppendResult(BaseModel):
+    """Result of appending a batch of entries."""
+
+    model_config = _MODEL_CONFIG
+
+    results: list[BatchEntryResult] = Field(..., description="Per-entry results, in order")
+    summary: BatchSummary = Field(..., description="Success and failure counts")
+    previous_root: str | None = Field(
+        None, alias="previousRoot", description="Root hash before append (None if nothing was sent)"
+    )
+    new_root: str | None = Field(
+        None, alias="newRoot", description="Root hash after append (None if nothing was sent)"
+    )
 
 
 class ListEntriesResult(BaseModel):
     """Paginated list of entries."""
 
+    model_config = _MODEL_CONFIG
+
     entries: list[LedgerEntry] = Field(..., description="Array of entries")
     total: str = Field(..., description="Total number of entries")
     offset: str = Field(..., description="Current offset")
@@ -89,6 +191,8 @@ class ListEntriesResult(BaseModel):
 class ListLedgersResult(BaseModel):
     """Paginated list of ledgers."""
 
+    model_config = _MODEL_CONFIG
+
     ledgers: list[Ledger] = Field(..., description="Array of ledgers")
     total: int = Field(..., description="Total number of ledgers")
     offset: int = Field(..., description="Current offset")
@@ -98,6 +202,8 @@ class ListLedgersResult(BaseModel):
 class VerifyProofResult(BaseModel):
     """Proof verification result."""
 
+    model_config = _MODEL_CONFIG
+
     valid: bool = Field(..., description="Whether the proof is valid")
     leaf: str = Field(..., description="Leaf hash that was verified")
     root: str = Field(..., description="Root hash that was verified against")
@@ -105,59 +211,69 @@ class VerifyProofResult(BaseModel):
     proof_length: int = Field(..., alias="proofLength", description="Number of proof hashes")
     error: str | None = Field(None, description="Error message if verification failed")
 
-    class Config:
-        populate_by_name = True
-
 
 class PublicRoot(BaseModel):
     """Public root information."""
 
+    model_config = _MODEL_CONFIG
+
     ledger_id: str = Field(..., alias="ledgerId", description="Ledger ID")
     root_hash: str = Field(..., alias="rootHash", description="Current root hash")
     entry_count: str = Field(..., alias="entryCount", description="Entry count")
     timestamp: str = Field(..., description="Timestamp")
     signature: str | None = Field(None, description="Optional signature")
 
-    class Config:
-        populate_by_name = True
-
 
 class HistoricalRoot(BaseModel):
     """Historical root entry."""
 
+    model_config = _MODEL_CONFIG
+
     root_hash: str = Field(..., alias="rootHash", description="Root hash at this point")
     entry_count: str = Field(..., alias="entryCount", description="Entry count at this point")
     timestamp: str = Field(..., description="Timestamp")
     signature: str | None = Field(None, description="Optional signature")
 
-    class Config:
-        populate_by_name = True
-
 
 class PublicRootsResult(BaseModel):
     """Result of fetching historical roots."""
 
+    model_config = _MODEL_CONFIG
+
     ledger_id: str = Field(..., alias="ledgerId", description="Ledger ID")
     roots: list[HistoricalRoot] = Field(..., description="Historical roots")
     total: int = Field(..., description="Total count")
     offset: int = Field(..., description="Current offset")
     limit: int = Field(..., description="Page size limit")
 
-    class Config:
-        populate_by_name = True
+
+class ProofResponse(BaseModel):
+    """Response of the proof endpoint."""
+
+    model_config = _MODEL_CONFIG
+
+    proof: MerkleProof = Field(..., description="The Merkle proof")
 
 
 class ApiError(BaseModel):
     """API error response."""
 
+    model_config = _MODEL_CONFIG
+
     code: str = Field(..., description="Error code")
     message: str = Field(..., description="Human-readable error message")
     details: Any | None = Field(None, description="Additional error details")
 
 
+# Compiled validator for untyped JSON object responses (health, current root)
+JSON_OBJECT_ADAPTER: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+
 class VeilChainError(Exception):
     """VeilChain SDK error."""
 
+    __slots__ = ("status", "code", "details")
+
     def __init__(
         self,
         message: str,
@@ -6,31 +6,86 @@ This module provides offline proof verification without network dependencies.
 from __future__ import annotations
 
 import hashlib
+import hmac
 import json
+from collections.abc import Sequence
 from typing import Any, Literal
 
 from .types import CompactProof, MerkleProof, VerifyProofResult
 
 
-def _hex_to_bytes(hex_str: str) -> bytes:
-    """Convert a hex string to bytes."""
-    return bytes.fromhex(hex_str)
+def _sha256(data: bytes) -> str:
+    """Compute SHA-256 hash."""
+    return hashlib.sha256(data).hexdigest()
 
 
-def _bytes_to_hex(data: bytes) -> str:
-    """Convert bytes to hex string."""
-    return data.hex()
+def _sha256_raw(data: bytes) -> bytes:
+    """Compute SHA-256 digest as raw bytes."""
+    return hashlib.sha256(data).digest()
 
 
-def _sha256(data: bytes) -> str:
-    """Compute SHA-256 hash."""
-    return hashlib.sha256(data).hexdigest()
+def _verify_proof_core(proof: MerkleProof) -> tuple[bool, str | None]:
+    """Verify a Merkle inclusion proof, returning (valid, error)."""
+    # Validate input
+    if len(proof.leaf) != 64:
+        return False, "Invalid leaf hash: must be 64 character hex string"
+
+    if len(proof.root) != 64:
+        return False, "Invalid root hash: must be 64 character hex string"
 
+    if len(proof.proof) != len(proof.directions):
+        return False, "Proof and directions arrays must have the same length"
 
-def _hash_pair(left: str, right: str) -> str:
-    """Compute SHA-256 hash of two concatenated hashes."""
-    combined = _hex_to_bytes(left) + _hex_to_bytes(right)
-    return _sha256(combined)
+    # Decode the hex once (cached on the proof); bytes.fromhex doubles as the
+    # hex check, so malformed input fails here rather than inside the loop
+    try:
+        current_hash = proof.leaf_bytes
+        root_hash = proof.root_bytes
+        siblings = proof.proof_bytes
+    except ValueError:
+        return False, "Invalid hash: leaf, root and proof must be hex strings"
+
+    # bytes.fromhex skips whitespace, so check the decoded lengths as well
+    if len(current_hash) != 32:
+        return False, "Invalid leaf hash: must be 64 character hex string"
+    if len(root_hash) != 32:
+        return False, "Invalid root hash: must be 64 character hex string"
+    if any(len(sibling) != 32 for sibling in siblings):
+        return False, "Invalid proof hash: must be 64 character hex strings"
+
+    # Compute root from leaf and proof path, keeping hashes as raw bytes
+    sha256 = hashlib.sha256
+    bits = proof.direction_bits
+
+    for sibling_hash in siblings:
+        if bits & 1:
+            # Sibling is on the right, current is on the left
+            current_hash = sha256(current_hash + sibling_hash).digest()
+        else:
+            # Sibling is on the left, current is on the right
+            current_hash = sha256(sibling_hash + current_hash).digest()
+        bits >>= 1
+
+    if not hmac.compare_digest(current_hash, root_hash):
+        return False, "Computed root does not match expected root"
+    return True, None
+
+
+# Results are validated with the models' core validators directly, which skips
+# the Python-level BaseModel.__init__ wrapper (about 40% of construction time)
+_validate_result = VerifyProofResult.__pydantic_validator__.validate_python
+
+
+def _result_fields(proof: MerkleProof, valid: bool, error: str | None) -> dict[str, Any]:
+    """Collect the fields of a verification result for a proof."""
+    return {
+        "valid": valid,
+        "leaf": proof.leaf,
+        "root": proof.root,
+        "index": proof.index,
+        "proofLength": len(proof.proof),
+        "error": error,
+    }
 
 
 def verify_proof(proof: MerkleProof) -> VerifyProofResult:
@@ -58,68 +113,135 @@ def verify_proof(proof: MerkleProof) -> VerifyProofResult:
         >>> if result.valid:
         ...     print('Proof is valid!')
     """
-    try:
-        # Validate input
-        if not proof.leaf or len(proof.leaf) != 64:
-            return VerifyProofResult(
-                valid=False,
-                leaf=proof.leaf or "",
-                root=proof.root or "",
-                index=proof.index or 0,
-                proofLength=len(proof.proof) if proof.proof else 0,
-                error="Invalid leaf hash: must be 64 character hex string",
-            )
-
-        if not proof.root or len(proof.root) != 64:
-            return VerifyProofResult(
-                valid=False,
-                leaf=proof.leaf,
-                root=proof.root or "",
-                index=proof.index or 0,
-                proofLength=len(proof.proof) if proof.proof else 0,
-                error="Invalid root hash: must be 64 character hex string",
-            )
-
-        if len(proof.proof) != len(proof.directions):
-            return VerifyProofResult(
-                valid=False,
-                leaf=proof.leaf,
-                root=proof.root,
-                index=proof.index,
-                proofLength=len(proof.proof),
-                error="Proof and directions arrays must have the same length",
-            )
-
-        # Compute root from leaf and proof path
-        current_hash = proof.leaf
-
-        for sibling_hash, direction in zip(proof.proof, proof.directions):
-            if direction == "left":
-                # Sibling is on the left, current is on the right
-                current_hash = _hash_pair(sibling_hash, current_hash)
+    valid, error = _verify_proof_core(proof)
+    result: VerifyProofResult = _validate_result(_result_fields(proof, valid, error))
+    return result
+
+
+class Verifier:
+    """Verify many Merkle inclusion proofs against one trusted root.
+
+    Every node on the path of a proof that verifies is remembered together
+    with the rest of that path (its remaining siblings and directions). A later
+    proof that reaches a remembered node with the same remaining path stops
+    hashing there, since that path has already been checked up to the root.
+    Proofs from the same tree share most of their upper levels, so an audit of
+    a whole ledger hashes each interior node about once instead of once per
+    entry, with the same result as calling verify_proof on each proof.
+
+    The trusted set grows with the number of distinct nodes seen; create a
+    new Verifier per root.
+
+    Example:
+        >>> from veilchain import Verifier
+        >>> verifier = Verifier(client.get_public_root(ledger_id).root_hash)
+        >>> for proof in proofs:
+        ...     assert verifier.verify(proof)
+    """
+
+    def __init__(self, root: str) -> None:
+        """Create a verifier.
+
+        Args:
+            root: The trusted root hash (hex)
+
+        Raises:
+            ValueError: If root is not a 64 character hex string
+        """
+        root_bytes = bytes.fromhex(root)
+        if len(root_bytes) != 32:
+            raise ValueError("Invalid root hash: must be 64 character hex string")
+        self.root = root
+        self._root_bytes = root_bytes
+        # node hash -> (siblings, level, direction bits) of the proof that
+        # verified it; siblings[level:] is the remaining path to the root
+        self._trusted: dict[bytes, tuple[tuple[bytes, ...], int, int]] = {root_bytes: ((), 0, 0)}
+
+    def verify(self, proof: MerkleProof) -> bool:
+        """Verify a proof against the trusted root (its own ``root`` field is ignored).
+
+        Args:
+            proof: The Merkle proof to verify
+
+        Returns:
+            True if the proof's leaf is included under the root
+        """
+        try:
+            current_hash = proof.leaf_bytes
+            siblings = proof.proof_bytes
+        except ValueError:
+            return False
+        if (
+            len(current_hash) != 32
+            or len(siblings) != len(proof.directions)
+            or any(len(sibling) != 32 for sibling in siblings)
+        ):
+            return False
+
+        trusted = self._trusted
+        sha256 = hashlib.sha256
+        path: list[tuple[bytes, int, int]] = []
+        bits = proof.direction_bits
+        level = 0
+
+        for sibling_hash in siblings:
+            if current_hash in trusted:
+                break
+            path.append((current_hash, level, bits))
+            if bits & 1:
+                current_hash = sha256(current_hash + sibling_hash).digest()
             else:
-                # Sibling is on the right, current is on the left
-                current_hash = _hash_pair(current_hash, sibling_hash)
-
-        valid = current_hash == proof.root
-
-        return VerifyProofResult(
-            valid=valid,
-            leaf=proof.leaf,
-            root=proof.root,
-            index=proof.index,
-            proofLength=len(proof.proof),
-            error=None if valid else "Computed root does not match expected root",
-        )
-    except Exception as e:
-        return VerifyProofResult(
-            valid=False,
-            leaf=proof.leaf or "",
-            root=proof.root or "",
-            index=proof.index or 0,
-            proofLength=len(proof.proof) if proof.proof else 0,
-            error=str(e),
-        )
+                current_hash = sha256(sibling_hash + current_hash).digest()
+            bits >>= 1
+            level += 1
+
+        # Stopping early is only sound if the rest of the path is exactly the
+        # one already checked from this node; otherwise (e.g. a duplicate
+        # entry at another position) finish hashing it
+        known = trusted.get(current_hash)
+        if known is None:
+            return False
+        known_siblings, known_level, known_bits = known
+        if bits != known_bits or siblings[level:] != known_siblings[known_level:]:
+            for sibling_hash in siblings[level:]:
+                if bits & 1:
+                    current_hash = sha256(current_hash + sibling_hash).digest()
+                else:
+                    current_hash = sha256(sibling_hash + current_hash).digest()
+                bits >>= 1
+            return hmac.compare_digest(current_hash, self._root_bytes)
+
+        for node_hash, node_level, node_bits in path:
+            trusted.setdefault(node_hash, (siblings, node_level, node_bits))
+        return True
+
+
+def verify_proofs(proofs: Sequence[MerkleProof], root: str) -> list[bool]:
+    """Verify many Merkle inclusion proofs against the same root hash.
+
+    This is the batch form of verify_proof for audits that check many entries
+    against one published root. Each proof is checked against ``root`` (its own
+    ``root`` field is ignored) using a Verifier, so levels shared between
+    proofs (typically those near the root) are only hashed once.
+
+    Args:
+        proofs: The Merkle proofs to verify
+        root: The trusted root hash (hex)
+
+    Returns:
+        One boolean per proof, True if the proof is valid
+
+    Example:
+        >>> from veilchain import verify_proofs
+        >>> root = client.get_public_root(ledger_id).root_hash
+        >>> results = verify_proofs(proofs, root)
+        >>> print(all(results))
+    """
+    try:
+        verifier = Verifier(root)
+    except ValueError:
+        return [False] * len(proofs)
+    return [verifier.verify(proof) for proof in proofs]
 
 
 def parse_compact_proof(compact: CompactProof) -> MerkleProof:
@@ -138,9 +260,8 @@ def parse_compact_proof(compact: CompactProof) -> MerkleProof:
         >>> result = verify_proof(proof)
     """
     # Split concatenated proof hashes (each is 64 chars for SHA256)
-    proof_hashes: list[str] = []
-    for i in range(0, len(compact.p), 64):
-        proof_hashes.append(compact.p[i : i + 64])
+    p = compact.p
+    proof_hashes = [p[i : i + 64] for i in range(0, len(p), 64)]
 
     # Parse directions from binary string
     directions: list[Literal["left", "right"]] = [
@@ -171,7 +292,7 @@ def to_compact_proof(proof: MerkleProof) -> CompactProof:
         r=proof.root,
         i=proof.index,
         p="".join(proof.proof),
-        d="".join("0" if d == "left" else "1" for d in proof.directions),
+        d="".join(["0" if d == "left" else "1" for d in proof.directions]),
     )
 
 
@@ -189,8 +310,24 @@ def hash_data(data: Any) -> str:
         >>> hash_value = hash_data({'vote': 'yes', 'voter': 'alice'})
         >>> print(hash_value)  # '5a3b...'
     """
-    serialized = data if isinstance(data, str) else json.dumps(data, separators=(",", ":"))
-    return _sha256(serialized.encode("utf-8"))
+    return _sha256(_serialize(data))
+
+
+def _serialize(data: Any) -> bytes:
+    """Encode data the way hash_data hashes it.
+
+    Always uses the standard library encoder (never orjson), so a hash does not
+    depend on which optional extras are installed. Output matches JavaScript's
+    JSON.stringify for strings, integers within +/-2**53, booleans, null, and
+    lists and dicts of those: compact and non-ASCII left as UTF-8. Other
+    numbers differ from the JS SDK: floats use Python's repr (1.0 stays "1.0"
+    and 1e16 becomes "1e+16" where JS writes "1" and "10000000000000000"),
+    NaN and Infinity are written as-is rather than as null, and larger
+    integers are exact rather than rounded.
+    """
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
 def verify_data(data: Any, expected_hash: str) -> bool:
@@ -207,8 +344,11 @@ def verify_data(data: Any, expected_hash: str) -> bool:
         >>> from veilchain import verify_data
         >>> is_valid = verify_data({'vote': 'yes'}, '5a3b...')
     """
-    actual_hash = hash_data(data)
-    return actual_hash == expected_hash
+    try:
+        expected = bytes.fromhex(expected_hash)
+    except ValueError:
+        return False
+    return hmac.compare_digest(_sha256_raw(_serialize(data)), expected)
 
 
 class DataVerifyResult(VerifyProofResult):
@@ -217,6 +357,9 @@ class DataVerifyResult(VerifyProofResult):
     data_match: bool
 
 
+_validate_data_result = DataVerifyResult.__pydantic_validator__.validate_python
+
+
 def verify_data_with_proof(data: Any, proof: MerkleProof) -> DataVerifyResult:
     """Verify a proof against known data.
 
@@ -237,27 +380,18 @@ def verify_data_with_proof(data: Any, proof: MerkleProof) -> DataVerifyResult:
         >>> if result.valid and result.data_match:
         ...     print('Vote is verified in the ledger!')
     """
-    data_hash = hash_data(data)
-    data_match = data_hash == proof.leaf
-
-    if not data_match:
-        return DataVerifyResult(
-            valid=False,
-            data_match=False,
-            leaf=proof.leaf,
-            root=proof.root,
-            index=proof.index,
-            proofLength=len(proof.proof),
-            error="Data hash does not match proof leaf",
-        )
-
-    proof_result = verify_proof(proof)
-    return DataVerifyResult(
-        valid=proof_result.valid,
-        data_match=True,
-        leaf=proof_result.leaf,
-        root=proof_result.root,
-        index=proof_result.index,
-        proofLength=proof_result.proof_length,
-        error=proof_result.error,
-    )
+    data_hash = _sha256_raw(_serialize(data))
+    try:
+        data_match = hmac.compare_digest(data_hash, proof.leaf_bytes)
+    except ValueError:
+        data_match = False
+
+    if data_match:
+        valid, error = _verify_proof_core(proof)
+    else:
+        valid, error = False, "Data hash does not match proof leaf"
+
+    fields = _result_fields(proof, valid, error)
+    fields["data_match"] = data_match
+    result: DataVerifyResult = _validate_data_result(fields)
+    return result